@@ -68,29 +68,70 @@ import threading
 import queue
 import logging
 import re
+import functools
+import importlib.util
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 from pathlib import Path
-from typing import List, Dict, Optional, Callable, Any
+from typing import List, Dict, Optional, Callable, Any, Iterable, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import signal
 import psutil
-import win32gui
-import win32con
-import win32api
-import win32process
-import win32clipboard
-from PIL import ImageGrab
-import pygetwindow as gw
-
-# Optional OCR import - only used as fallback
+from PIL import Image, ImageGrab
+
+# Windows desktop automation (pywin32, pygetwindow, pyautogui). Guarded only off
+# Windows, so the platform-independent parts of this module - task loading,
+# RateLimitParser, Scheduler - can still be imported (and checked) elsewhere.
+# On Windows, the platform this tool targets, a missing or broken package must
+# fail loudly at import rather than turn into NameErrors deep inside readers.
+WIN32_IMPORT_ERROR: Optional[BaseException] = None
+try:
+    import win32gui
+    import win32con
+    import win32api
+    import win32process
+    import win32clipboard
+    import pygetwindow as gw
+    import pyautogui
+    HAS_WIN32 = True
+except (ImportError, NotImplementedError) as e:  # pygetwindow raises NotImplementedError off Windows
+    if sys.platform == "win32":
+        raise
+    HAS_WIN32 = False
+    WIN32_IMPORT_ERROR = e  # Reported by find_terminal_windows (logging isn't set up yet)
+
+# Optional OCR support - only used as fallback. easyocr drags in torch, which takes
+# seconds to import, so we only check it is installed here and import it on first use
+HAS_OCR = importlib.util.find_spec("easyocr") is not None
+
+
+@functools.lru_cache(maxsize=1)
+def get_ocr_reader():
+    """Return the process-wide EasyOCR reader, building it on first call
+    
+    Creating a Reader loads the detection and recognition models from disk,
+    which takes seconds - far longer than the OCR pass itself - so every
+    screenshot reuses the same instance.
+    """
+    import easyocr  # Heavy import, deferred until OCR is really needed
+    return easyocr.Reader(['en'], gpu=False)  # Use CPU for better compatibility
+
+# Optional fast JSON parser - falls back to the standard library json module
 try:
-    import easyocr
-    HAS_OCR = True
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    HAS_OCR = False
-import pyautogui
+    HAS_ORJSON = False
+
+
+# Log/menu separators - built once at import instead of on every banner
+SEPARATOR_WIDE = "=" * 80
+SEPARATOR_MEDIUM = "=" * 60
+SEPARATOR_NARROW = "=" * 50
+
+# Timezone Claude's rate limit reset times are reported in (resolved once at import)
+CLAUDE_TIMEZONE = ZoneInfo("America/New_York")
 
 
 class TerminalType(Enum):
@@ -119,7 +160,7 @@ class TaskStatus(Enum):
     RATE_LIMITED = "rate_limited"
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Represents a single task to execute"""
     id: int
@@ -131,7 +172,7 @@ class Task:
     error: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Configuration:
     """System configuration"""
     terminal_type: TerminalType = TerminalType.POWERSHELL
@@ -152,34 +193,125 @@ class Configuration:
     gui_mode: bool = False  # If True, creates hidden terminals for GUI-only operation
 
 
+# Patterns to detect rate limit messages - focusing on the specific format
+RATE_LIMIT_PATTERNS = (
+    r"5-hour limit reached.*resets",
+    r"5-hour limit reached.*∙.*resets",
+    r"rate limit reached.*resets",
+    r"limit reached.*resets",
+    r"quota exceeded.*resets",
+    r"usage limit.*resets",
+    r"daily limit.*resets",
+    r"hourly limit.*resets",
+    r"you've reached.*limit.*resets",
+    r"limit.*exceeded.*resets",
+    r"too many requests.*resets"
+)
+
+# Patterns to extract reset times from the specific format, each paired with the
+# literal text every match of it must start with. _extract_reset_time only tries
+# a pattern where its prefix occurs, so when adding a pattern the prefix must be
+# a required leading literal (lowercase) - for an alternation like "foo|bar" use
+# a common prefix or split it into two entries.
+RESET_TIME_PATTERNS = (
+    ("5-hour limit reached", r"5-hour limit reached.*∙.*resets\s+(\d{1,2}am|\d{1,2}pm)"),
+    ("reset", r"resets?\s+(\d{1,2}am|\d{1,2}pm)"),
+    ("reset", r"resets?\s+(\d{1,2}:\d{2})\s*(am|pm)?"),
+    ("reset", r"resets?\s+at\s+(\d{1,2}:\d{2})\s*(am|pm)?"),
+    ("next", r"next\s+reset\s+(\d{1,2}:\d{2})\s*(am|pm)?"),
+    ("available", r"available\s+at\s+(\d{1,2}:\d{2})\s*(am|pm)?")
+)
+
+# Compiled once at import and shared by every RateLimitParser. The detection
+# patterns are fused into a single alternation so one scan of the output finds
+# any of them; each alternative is a named group (p0, p1, ...) so we can still
+# tell which one matched.
+RATE_LIMIT_REGEX = re.compile("|".join(
+    f"(?P<p{i}>{pattern})" for i, pattern in enumerate(RATE_LIMIT_PATTERNS)
+))
+
+# A reset time match can only begin where its pattern's prefix occurs, so we
+# jump between occurrences with str.find (a fast literal search) and only try
+# regex.match there, instead of regex.search attempting a match at every
+# position of the output.
+RESET_TIME_REGEXES = tuple(
+    (prefix, re.compile(pattern)) for prefix, pattern in RESET_TIME_PATTERNS
+)
+
+
+@functools.lru_cache(maxsize=32)
+def parse_reset_clock(time_str: str) -> Tuple[int, int]:
+    """Convert a reset time like "4am" or "4:30 pm" to a 24-hour (hour, minute)
+    
+    Both the rate limit parser and the scheduler need this, and they keep
+    re-parsing the same handful of strings while waiting for a reset, so the
+    result is cached. Raises ValueError if the string isn't a clock time.
+    """
+    time_str = time_str.lower().strip()
+    if 'am' in time_str:
+        is_pm = False
+    elif 'pm' in time_str:
+        is_pm = True
+    else:
+        raise ValueError(f"Unknown time format: {time_str}")
+    
+    time_part = time_str.replace('am', '').replace('pm', '').strip()
+    hour_str, _, minute_str = time_part.partition(':')
+    hour = int(hour_str)
+    minute = int(minute_str) if minute_str else 0
+    
+    # Convert to 24-hour format
+    if is_pm and hour != 12:
+        hour += 12
+    elif not is_pm and hour == 12:
+        hour = 0
+    
+    return hour, minute
+
+
 class RateLimitParser:
     """Parses terminal output to detect rate limit messages and reset times"""
     
+    # Every rate limit pattern ends in "resets", so text without it can't match
+    REQUIRED_KEYWORD = "resets"
+    
     def __init__(self):
-        # Patterns to detect rate limit messages - focusing on the specific format
-        self.rate_limit_patterns = [
-            r"5-hour limit reached.*resets",
-            r"5-hour limit reached.*∙.*resets",
-            r"rate limit reached.*resets",
-            r"limit reached.*resets",
-            r"quota exceeded.*resets",
-            r"usage limit.*resets",
-            r"daily limit.*resets",
-            r"hourly limit.*resets",
-            r"you've reached.*limit.*resets",
-            r"limit.*exceeded.*resets",
-            r"too many requests.*resets"
-        ]
-        
-        # Patterns to extract reset times from the specific format
-        self.reset_time_patterns = [
-            r"5-hour limit reached.*∙.*resets\s+(\d{1,2}am|\d{1,2}pm)",
-            r"resets?\s+(\d{1,2}am|\d{1,2}pm)",
-            r"resets?\s+(\d{1,2}:\d{2})\s*(am|pm)?",
-            r"resets?\s+at\s+(\d{1,2}:\d{2})\s*(am|pm)?",
-            r"next\s+reset\s+(\d{1,2}:\d{2})\s*(am|pm)?",
-            r"available\s+at\s+(\d{1,2}:\d{2})\s*(am|pm)?"
-        ]
+        self.rate_limit_patterns = RATE_LIMIT_PATTERNS
+        self.reset_time_patterns = tuple(pattern for _, pattern in RESET_TIME_PATTERNS)
+        self._rate_limit_regex = RATE_LIMIT_REGEX
+        self._reset_time_regexes = RESET_TIME_REGEXES
+        
+        # The monitor loop often re-parses the exact same terminal snapshot
+        # (nothing new was printed since the last check). Remember the last
+        # snapshot and what the regex scan found in it so repeats skip the scan.
+        self._last_output: Optional[str] = None
+        self._last_scan: Optional[Tuple[Optional[str], Optional[str], Optional[str]]] = None
+    
+    def _find_rate_limit(self, output_lower: str) -> Optional[re.Match]:
+        """Find the first rate limit message in already-lowercased text
+        
+        No pattern spans a newline and every pattern ends in "resets", so only
+        lines containing that keyword can match. We locate those lines with
+        str.find (a fast literal search) and run the regex on just those line
+        slices instead of over the whole snapshot. Lines are visited top to
+        bottom, so the result is the same leftmost match a full search gives.
+        """
+        keyword_pos = output_lower.find(self.REQUIRED_KEYWORD)
+        while keyword_pos != -1:
+            line_start = output_lower.rfind("\n", 0, keyword_pos) + 1
+            line_end = output_lower.find("\n", keyword_pos)
+            if line_end == -1:
+                line_end = len(output_lower)
+            
+            match = self._rate_limit_regex.search(output_lower, line_start, line_end)
+            if match:
+                return match
+            keyword_pos = output_lower.find(self.REQUIRED_KEYWORD, line_end)
+        return None
+    
+    def has_rate_limit_message(self, output_lower: str) -> bool:
+        """Quick check whether already-lowercased text contains a rate limit message"""
+        return self._find_rate_limit(output_lower) is not None
     
     def parse_output(self, output: str) -> Dict[str, Any]:
         """Parse terminal output for rate limit information"""
@@ -190,24 +322,19 @@ class RateLimitParser:
             'matched_pattern': None
         }
         
-        output_lower = output.lower()
-        
-        # Check for rate limit messages
-        for pattern in self.rate_limit_patterns:
-            match = re.search(pattern, output_lower)
-            if match:
-                result['rate_limit_detected'] = True
-                result['message'] = output.strip()
-                result['matched_pattern'] = pattern
-                
-                # Log the match for debugging
-                logging.info(f"🎯 Rate limit pattern matched: '{pattern}'")
-                logging.info(f"📄 Matched text: '{match.group(0)}'")
-                break
+        pattern, matched_text, reset_time = self._scan_output(output)
+        if pattern:
+            result['rate_limit_detected'] = True
+            result['message'] = output.strip()
+            result['matched_pattern'] = pattern
+            
+            # Log the match for debugging
+            logging.info(f"🎯 Rate limit pattern matched: '{pattern}'")
+            logging.info(f"📄 Matched text: '{matched_text}'")
         
-        # Extract reset time if rate limit detected
+        # Validate the reset time if rate limit detected. Whether it is still current
+        # depends on the clock, so that part is never cached.
         if result['rate_limit_detected']:
-            reset_time = self._extract_reset_time(output)
             if reset_time:
                 # Validate if this is a current or old rate limit message
                 is_current = self._is_rate_limit_current(reset_time)
@@ -225,10 +352,43 @@ class RateLimitParser:
         
         return result
     
-    def _extract_reset_time(self, output: str) -> Optional[str]:
-        """Extract reset time from terminal output"""
-        for pattern in self.reset_time_patterns:
-            match = re.search(pattern, output.lower())
+    def _scan_output(self, output: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """Run the regex scan, returning (pattern, matched text, reset time)
+        
+        The result only depends on the text, so it is cached for the most
+        recent snapshot. Comparing against the stored string (identity, then
+        length, then contents) is much cheaper than the scan and can't give
+        a false hit the way a hash-only key could.
+        """
+        if self._last_scan is not None and output == self._last_output:
+            return self._last_scan
+        
+        pattern = matched_text = reset_time = None
+        
+        # Most snapshots contain no "resets" at all, in which case this
+        # returns without running the regex.
+        # Lowercase once and share it between the rate limit and reset time scans
+        output_lower = output.lower()
+        match = self._find_rate_limit(output_lower)
+        if match:
+            pattern = self.rate_limit_patterns[int(match.lastgroup[1:])]
+            matched_text = match.group(0)
+            reset_time = self._extract_reset_time(output_lower)
+        
+        self._last_output = output
+        self._last_scan = (pattern, matched_text, reset_time)
+        return self._last_scan
+    
+    def _extract_reset_time(self, output_lower: str) -> Optional[str]:
+        """Extract reset time from already-lowercased terminal output"""
+        for prefix, regex in self._reset_time_regexes:
+            match = None
+            start = output_lower.find(prefix)
+            while start != -1:
+                match = regex.match(output_lower, start)
+                if match:
+                    break
+                start = output_lower.find(prefix, start + 1)
             if match:
                 time_str = match.group(1)
                 
@@ -274,40 +434,17 @@ class RateLimitParser:
         - "5am" -> expired (was 9+ hours ago)
         - "4am" -> expired (was 10+ hours ago)
         """
-        from datetime import datetime, time
-        import pytz
-        
         try:
-            # Parse the reset time
+            # Parse the reset time into a 24-hour clock hour
             reset_time_str = reset_time_str.lower().strip()
-            
-            # Extract hour and am/pm
-            if 'am' in reset_time_str:
-                hour_str = reset_time_str.replace('am', '').strip().split(':')[0]
-                is_pm = False
-            elif 'pm' in reset_time_str:
-                hour_str = reset_time_str.replace('pm', '').strip().split(':')[0]
-                is_pm = True
-            else:
-                logging.warning(f"Unknown time format: {reset_time_str}")
-                return True  # Assume current if we can't parse
-            
-            # Parse hour
             try:
-                hour = int(hour_str)
-            except ValueError:
-                logging.warning(f"Could not parse hour from: {hour_str}")
+                hour, _ = parse_reset_clock(reset_time_str)
+            except ValueError as e:
+                logging.warning(f"Could not parse reset time: {e}")
                 return True  # Assume current if we can't parse
             
-            # Convert to 24-hour format
-            if is_pm and hour != 12:
-                hour += 12
-            elif not is_pm and hour == 12:
-                hour = 0
-            
             # Get current time in Eastern timezone (Claude's timezone)
-            eastern = pytz.timezone('America/New_York')
-            now = datetime.now(eastern)
+            now = datetime.now(CLAUDE_TIMEZONE)
             current_hour = now.hour
             
             logging.info(f"🕐 Time analysis: Reset={hour:02d}:00, Current={current_hour:02d}:{now.minute:02d}")
@@ -334,66 +471,89 @@ class RateLimitParser:
 class TerminalWindowManager:
     """Finds and controls existing terminal windows on Windows"""
     
+    # Common terminal window classes
+    TERMINAL_CLASSES = (
+        "ConsoleWindowClass",  # Windows Console
+        "CASCADIA_HOSTING_WINDOW_CLASS",  # Windows Terminal
+        "Windows.UI.Core.CoreWindow",  # Windows Terminal (newer)
+        "Mintty",  # Git Bash
+        "PuTTY",  # PuTTY
+        "VTE",  # Some Linux terminals
+    )
+    
+    # Terminal-related window titles (stored lowercase for case-insensitive matching)
+    TERMINAL_TITLES = tuple(title.lower() for title in (
+        "cmd", "Command Prompt", "PowerShell", "Windows PowerShell",
+        "Git Bash", "MINGW64", "Ubuntu", "WSL", "Terminal",
+        "Windows Terminal", "Alacritty", "Hyper", "Anaconda Prompt",
+        "conda", "python", "node", "npm", "yarn"
+    ))
+    
+    # Non-terminal windows to exclude (stored lowercase)
+    EXCLUDE_TITLES = tuple(title.lower() for title in (
+        "Settings", "Control Panel", "File Explorer",
+        "Microsoft Edge", "Chrome", "Firefox", "Notepad",
+        "Calculator", "Task Manager", "Device Manager"
+    ))
+    
     def __init__(self):
         self.terminal_windows = []
     
     def find_terminal_windows(self) -> List[Dict[str, Any]]:
         """Scans for all open terminal windows - the magic happens here"""
+        if not HAS_WIN32:
+            logging.warning(f"Windows automation unavailable ({WIN32_IMPORT_ERROR!r}), can't scan for terminal windows")
+            return []
+        
         windows = []
+        # Several windows often belong to the same process (e.g. conhost or
+        # Windows Terminal), so look each PID up only once per scan
+        process_info: Dict[int, tuple] = {}
         
+        # EnumWindows calls back into Python once per top-level window, so the
+        # callback does as little as possible: the match tables live on the class,
+        # the title is lowercased once, and untitled windows are dropped before
+        # any class-name lookup.
         def enum_windows_callback(hwnd, windows_list):
-            if win32gui.IsWindowVisible(hwnd):
-                window_text = win32gui.GetWindowText(hwnd)
-                class_name = win32gui.GetClassName(hwnd)
-                
-                # Check for common terminal window classes
-                terminal_classes = [
-                    "ConsoleWindowClass",  # Windows Console
-                    "CASCADIA_HOSTING_WINDOW_CLASS",  # Windows Terminal
-                    "Windows.UI.Core.CoreWindow",  # Windows Terminal (newer)
-                    "Mintty",  # Git Bash
-                    "PuTTY",  # PuTTY
-                    "VTE",  # Some Linux terminals
-                ]
-                
-                # Check for terminal-related window titles
-                terminal_titles = [
-                    "cmd", "Command Prompt", "PowerShell", "Windows PowerShell",
-                    "Git Bash", "MINGW64", "Ubuntu", "WSL", "Terminal",
-                    "Windows Terminal", "Alacritty", "Hyper", "Anaconda Prompt",
-                    "conda", "python", "node", "npm", "yarn"
-                ]
-                
-                # Exclude non-terminal windows
-                exclude_titles = [
-                    "Settings", "Settings", "Control Panel", "File Explorer",
-                    "Microsoft Edge", "Chrome", "Firefox", "Notepad",
-                    "Calculator", "Task Manager", "Device Manager"
-                ]
-                
-                # Check if it's a terminal window
-                is_terminal = (
-                    any(term_class in class_name for term_class in terminal_classes) or
-                    any(term_title.lower() in window_text.lower() for term_title in terminal_titles)
-                )
-                
-                # Exclude non-terminal windows
-                is_excluded = any(exclude_title.lower() in window_text.lower() for exclude_title in exclude_titles)
-                
-                if is_terminal and not is_excluded and window_text.strip():
-                    try:
-                        _, pid = win32process.GetWindowThreadProcessId(hwnd)
+            if not win32gui.IsWindowVisible(hwnd):
+                return
+            window_text = win32gui.GetWindowText(hwnd)
+            if not window_text.strip():
+                return
+            
+            title_lower = window_text.lower()
+            
+            # Exclude non-terminal windows
+            if any(exclude_title in title_lower for exclude_title in self.EXCLUDE_TITLES):
+                return
+            
+            # Check if it's a terminal window
+            class_name = win32gui.GetClassName(hwnd)
+            is_terminal = (
+                any(term_class in class_name for term_class in self.TERMINAL_CLASSES) or
+                any(term_title in title_lower for term_title in self.TERMINAL_TITLES)
+            )
+            
+            if is_terminal:
+                try:
+                    _, pid = win32process.GetWindowThreadProcessId(hwnd)
+                    if pid not in process_info:
+                        # oneshot() fetches the process details in a single
+                        # OS query instead of one per attribute
                         process = psutil.Process(pid)
-                        windows_list.append({
-                            'hwnd': hwnd,
-                            'title': window_text,
-                            'class_name': class_name,
-                            'pid': pid,
-                            'process_name': process.name(),
-                            'exe_path': process.exe()
-                        })
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        pass
+                        with process.oneshot():
+                            process_info[pid] = (process.name(), process.exe())
+                    process_name, exe_path = process_info[pid]
+                    windows_list.append({
+                        'hwnd': hwnd,
+                        'title': window_text,
+                        'class_name': class_name,
+                        'pid': pid,
+                        'process_name': process_name,
+                        'exe_path': exe_path
+                    })
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    pass
         
         win32gui.EnumWindows(enum_windows_callback, windows)
         self.terminal_windows = windows
@@ -423,7 +583,7 @@ class TerminalWindowManager:
         
         # Manual selection (for debugging)
         print("\nAvailable Terminal Windows:")
-        print("=" * 50)
+        print(SEPARATOR_NARROW)
         for i, window in enumerate(windows, 1):
             print(f"{i}. {window['title']}")
             print(f"   Process: {window['process_name']}")
@@ -540,38 +700,51 @@ class TerminalWindowManager:
 class InactivityMonitor:
     """Listens for silence - when your terminal stops talking, it knows you're done"""
     
-    def __init__(self, timeout_seconds: int = 600):
+    # Fixed attribute set: no per-instance __dict__, faster attribute access in the poll loop
+    __slots__ = ("timeout_seconds", "clock", "last_activity", "is_active", "_lock")
+    
+    def __init__(self, timeout_seconds: int = 600, clock: Callable[[], float] = time.monotonic):
         self.timeout_seconds = timeout_seconds
-        self.last_activity = time.time()
+        # Monotonic by default so wall-clock jumps (DST, NTP sync) can't end a task
+        # early; a fake clock can be passed in to drive the monitor without sleeping
+        self.clock = clock
+        self.last_activity = clock()
         self.is_active = False
         self._lock = threading.Lock()
     
     def update_activity(self):
         """Update the last activity timestamp"""
         with self._lock:
-            self.last_activity = time.time()
+            self.last_activity = self.clock()
             self.is_active = True
     
+    def seconds_since_activity(self) -> float:
+        """Seconds elapsed since the last recorded activity"""
+        with self._lock:
+            return self.clock() - self.last_activity
+    
     def is_inactive(self) -> bool:
         """Check if terminal has been inactive for the timeout period"""
         with self._lock:
             if not self.is_active:
                 return False
-            return (time.time() - self.last_activity) >= self.timeout_seconds
+            return (self.clock() - self.last_activity) >= self.timeout_seconds
     
     def reset(self):
         """Reset the monitor"""
         with self._lock:
-            self.last_activity = time.time()
+            self.last_activity = self.clock()
             self.is_active = False
 
 
 class TerminalManager:
     """Handles all the terminal stuff - finding, connecting, and talking to terminals"""
     
-    def __init__(self, terminal_type: TerminalType, connection_mode: TerminalConnectionMode = TerminalConnectionMode.NEW_WINDOW):
+    def __init__(self, terminal_type: TerminalType, connection_mode: TerminalConnectionMode = TerminalConnectionMode.NEW_WINDOW,
+                 config: Optional[Configuration] = None):
         self.terminal_type = terminal_type
         self.connection_mode = connection_mode
+        self.config = config  # Owning system's config; looked up lazily when not given
         self.process: Optional[subprocess.Popen] = None
         self.output_queue = queue.Queue()
         self.error_queue = queue.Queue()
@@ -760,6 +933,9 @@ class TerminalManager:
             return None
 
     def _get_config(self) -> Optional[Configuration]:
+        # Config handed in by the owner (or found on a previous call) - no lookup needed
+        if self.config is not None:
+            return self.config
         # Walk up to TerminalAutomationSystem to fetch config
         try:
             # TerminalManager is owned by TerminalAutomationSystem → access via attribute search
@@ -768,6 +944,8 @@ class TerminalManager:
             for obj in gc.get_objects():
                 try:
                     if isinstance(obj, TerminalAutomationSystem) and obj.terminal_manager is self:
+                        # Cache it so transcript polling doesn't rescan the whole heap
+                        self.config = obj.config
                         return obj.config
                 except Exception:
                     continue
@@ -872,27 +1050,29 @@ class TerminalManager:
             logging.error(f"Failed to send command: {e}")
             return False
     
+    @staticmethod
+    def _drain_queue(source: queue.Queue) -> List[str]:
+        """Take every item currently in a queue without blocking
+        
+        get_nowait() already raises Empty when there is nothing left, so we
+        skip the separate empty() call (and its extra lock round-trip) per item.
+        """
+        items = []
+        get_nowait = source.get_nowait
+        try:
+            while True:
+                items.append(get_nowait())
+        except queue.Empty:
+            pass
+        return items
+    
     def get_output(self) -> List[str]:
         """Get all available output lines"""
-        output_lines = []
-        while not self.output_queue.empty():
-            try:
-                line = self.output_queue.get_nowait()
-                output_lines.append(line)
-            except queue.Empty:
-                break
-        return output_lines
+        return self._drain_queue(self.output_queue)
     
     def get_errors(self) -> List[str]:
         """Get all available error lines"""
-        error_lines = []
-        while not self.error_queue.empty():
-            try:
-                line = self.error_queue.get_nowait()
-                error_lines.append(line)
-            except queue.Empty:
-                break
-        return error_lines
+        return self._drain_queue(self.error_queue)
     
     def is_running(self) -> bool:
         """Check if terminal is still running"""
@@ -924,7 +1104,8 @@ class TerminalManager:
 class TaskExecutor:
     """The worker that types your tasks and waits for them to finish"""
     
-    def __init__(self, terminal_manager: TerminalManager, inactivity_monitor: InactivityMonitor, automation_system=None):
+    def __init__(self, terminal_manager: TerminalManager, inactivity_monitor: InactivityMonitor, automation_system=None,
+                 clock: Callable[[], float] = time.time, sleep: Callable[[float], None] = time.sleep):
         self.terminal_manager = terminal_manager
         self.inactivity_monitor = inactivity_monitor
         self.automation_system = automation_system  # Reference to main system for rate limit checks
@@ -932,6 +1113,31 @@ class TaskExecutor:
         self.rate_limit_parser = RateLimitParser()
         self.rate_limit_detected = False
         self.detected_reset_time: Optional[str] = None
+        # Bounds (seconds) for the adaptive terminal content polling in execute_task
+        self.content_poll_min_interval = 1.0
+        self.content_poll_max_interval = 16.0
+        # Bounds (seconds) for the execute_task loop sleep, which adapts to output load
+        self.loop_min_interval = 0.25
+        self.loop_max_interval = 1.0
+        # Source of "now" and the way execute_task waits - swap in fakes to check
+        # the polling/backoff schedule without patching time or really sleeping
+        self.clock = clock
+        self.sleep = sleep
+    
+    def _parse_new_output(self, baseline: str, baseline_is_clean: bool, content: str) -> Dict[str, Any]:
+        """Parse content for rate limits, skipping lines already seen in the baseline
+        
+        When content just extends a baseline known to contain no rate limit
+        message, only the lines from the baseline's last (possibly partial)
+        line onward can hold one, so that tail is checked first and the full
+        parse only runs if it finds something. Gives the same answer as
+        parse_output(content).
+        """
+        if baseline_is_clean and content.startswith(baseline):
+            tail_start = baseline.rfind("\n") + 1
+            if not self.rate_limit_parser.has_rate_limit_message(content[tail_start:].lower()):
+                return {'rate_limit_detected': False, 'reset_time': None, 'message': None, 'matched_pattern': None}
+        return self.rate_limit_parser.parse_output(content)
     
     def execute_task(self, task: Task) -> Task:
         """🚀 EXECUTE TASK - Send task to Claude and monitor for completion
@@ -943,9 +1149,9 @@ class TaskExecutor:
         4. 🚫 Detects rate limits during execution
         5. ✅ Returns task with updated status and timing info
         """
-        logging.info("="*60)
+        logging.info(SEPARATOR_MEDIUM)
         logging.info(f"🚀 STARTING TASK EXECUTION")
-        logging.info("="*60)
+        logging.info(SEPARATOR_MEDIUM)
         
         self.current_task = task
         task.status = TaskStatus.RUNNING
@@ -967,6 +1173,10 @@ class TaskExecutor:
             except Exception as e:
                 logging.warning(f"Could not capture initial content: {e}")
         
+        # Check the baseline for rate limit messages once. If it has none, later
+        # snapshots that only append to it need just their new lines scanned.
+        initial_is_clean = not self.rate_limit_parser.has_rate_limit_message(initial_content.lower())
+        
         # Send the task to the terminal
         if not self.terminal_manager.send_command(task.content):
             task.status = TaskStatus.FAILED
@@ -986,11 +1196,20 @@ class TaskExecutor:
         # Wait for Claude to start working by detecting terminal content changes
         logging.info("Waiting for Claude to start working (monitoring for terminal changes)...")
         claude_started = False
-        start_time = time.time()
-        last_rate_limit_check = time.time()
+        start_time = self.clock()
+        last_rate_limit_check = self.clock()
         output_lines = []
         error_lines = []
         
+        # Clipboard reads of an existing window are expensive (focus + select-all + copy
+        # with sleeps in between), so poll fast while the terminal is changing and
+        # back off exponentially while it sits still
+        content_poll_interval = self.content_poll_min_interval
+        next_content_poll = 0.0
+        last_polled_content = initial_content
+        loop_interval = self.loop_max_interval
+        last_status_log = self.clock()
+        
         while True:
             # Check if terminal is still running
             if not self.terminal_manager.is_running():
@@ -999,16 +1218,24 @@ class TaskExecutor:
                 break
             
             # For existing windows, check if terminal content has changed
-            if self.terminal_manager._is_existing_window:
+            if self.terminal_manager._is_existing_window and self.clock() >= next_content_poll:
                 try:
                     current_content = self.automation_system._try_clipboard_copy_method() or ""
                     
+                    # Snap back to fast polling on any change, otherwise double the interval
+                    if current_content != last_polled_content:
+                        content_poll_interval = self.content_poll_min_interval
+                    else:
+                        content_poll_interval = min(content_poll_interval * 2, self.content_poll_max_interval)
+                    last_polled_content = current_content
+                    next_content_poll = self.clock() + content_poll_interval
+                    
                     # If not started yet, check if Claude started working
                     if not claude_started:
                         # If content changed from initial state
                         if current_content != initial_content and len(current_content) > len(initial_content):
                             # Check if it's a rate limit change
-                            rate_limit_info = self.rate_limit_parser.parse_output(current_content)
+                            rate_limit_info = self._parse_new_output(initial_content, initial_is_clean, current_content)
                             
                             if not rate_limit_info['rate_limit_detected']:
                                 # Content changed and it's NOT a rate limit = Claude is working!
@@ -1030,12 +1257,12 @@ class TaskExecutor:
                                 self.inactivity_monitor.update_activity()
                                 self.last_content = current_content
                                 # Reset 2-minute check timer
-                                self.last_2min_check = time.time()
+                                self.last_2min_check = self.clock()
                         elif not hasattr(self, 'last_content'):
                             # Initialize last_content if not set
                             self.last_content = current_content
                             # Initialize 2-minute check timer
-                            self.last_2min_check = time.time()
+                            self.last_2min_check = self.clock()
                             
                 except Exception as e:
                     logging.debug(f"Error checking terminal content change: {e}")
@@ -1048,32 +1275,37 @@ class TaskExecutor:
                 output_lines.extend(new_output)
                 logging.debug(f"Task {task.id} output: {new_output}")
                 
+                # Indicators and rate limit messages never span lines, so only the lines
+                # that just arrived need scanning - earlier lines were checked already
+                new_output_lower = "\n".join(new_output).lower()
+                
                 # For new windows, check if Claude has started working (look for typical Claude output patterns)
                 if not self.terminal_manager._is_existing_window and not claude_started:
-                    full_output = "\n".join(output_lines).lower()
                     claude_working_indicators = [
                         "thinking", "analyzing", "processing", "generating", "writing",
                         "creating", "building", "implementing", "coding", "working"
                     ]
                     
-                    if any(indicator in full_output for indicator in claude_working_indicators):
+                    if any(indicator in new_output_lower for indicator in claude_working_indicators):
                         claude_started = True
                         logging.info("Claude has started working - beginning inactivity monitoring")
                         self.inactivity_monitor.reset()  # Reset inactivity monitor now
                 
-                # Check for rate limit messages in the output
-                full_output = "\n".join(output_lines)
-                rate_limit_info = self.rate_limit_parser.parse_output(full_output)
-                if rate_limit_info['rate_limit_detected']:
-                    self.rate_limit_detected = True
-                    self.detected_reset_time = rate_limit_info['reset_time']
-                    task.status = TaskStatus.RATE_LIMITED
-                    task.output = "\n".join(output_lines)
-                    logging.info(f"Rate limit detected: {rate_limit_info['message']}")
-                    if rate_limit_info['reset_time']:
-                        logging.info(f"Reset time detected: {rate_limit_info['reset_time']}")
-                    logging.info(f"Task {task.id} marked as RATE_LIMITED - will retry after reset")
-                    break
+                # Check for rate limit messages in the output. The full output is only
+                # parsed (for the reset time) when the new lines contain a message.
+                if self.rate_limit_parser.has_rate_limit_message(new_output_lower):
+                    full_output = "\n".join(output_lines)
+                    rate_limit_info = self.rate_limit_parser.parse_output(full_output)
+                    if rate_limit_info['rate_limit_detected']:
+                        self.rate_limit_detected = True
+                        self.detected_reset_time = rate_limit_info['reset_time']
+                        task.status = TaskStatus.RATE_LIMITED
+                        task.output = full_output
+                        logging.info(f"Rate limit detected: {rate_limit_info['message']}")
+                        if rate_limit_info['reset_time']:
+                            logging.info(f"Reset time detected: {rate_limit_info['reset_time']}")
+                        logging.info(f"Task {task.id} marked as RATE_LIMITED - will retry after reset")
+                        break
                 
                 # Update inactivity monitor only after Claude starts working
                 if claude_started:
@@ -1090,8 +1322,8 @@ class TaskExecutor:
             if (self.terminal_manager._is_existing_window and 
                 claude_started and  # Only check after Claude starts
                 self.inactivity_monitor.is_inactive() and  # Only when Claude is inactive
-                time.time() - last_rate_limit_check > 60):  # Check every minute during inactivity
-                last_rate_limit_check = time.time()
+                self.clock() - last_rate_limit_check > 60):  # Check every minute during inactivity
+                last_rate_limit_check = self.clock()
                 logging.debug("Claude appears inactive - checking for rate limits...")
                 
                 # Use the new rate limit checking method from the main automation system
@@ -1104,12 +1336,12 @@ class TaskExecutor:
             # Check for inactivity timeout only after Claude starts working
             if claude_started:
                 is_inactive = self.inactivity_monitor.is_inactive()
-                time_since_activity = time.time() - self.inactivity_monitor.last_activity
+                time_since_activity = self.inactivity_monitor.seconds_since_activity()
                 
                 # Check for 2-minute auto-advance (existing windows only)
                 if (self.terminal_manager._is_existing_window and 
                     hasattr(self, 'last_2min_check') and 
-                    time.time() - self.last_2min_check >= 120):  # 2 minutes = 120 seconds
+                    self.clock() - self.last_2min_check >= 120):  # 2 minutes = 120 seconds
                     
                     # Check if terminal content changed in the last 2 minutes
                     try:
@@ -1136,15 +1368,16 @@ class TaskExecutor:
                         else:
                             # Content did change, reset the 2-minute timer
                             self.last_content = current_content
-                            self.last_2min_check = time.time()
+                            self.last_2min_check = self.clock()
                             logging.debug("Terminal content changed within 2-minute window - continuing")
                     except Exception as e:
                         logging.debug(f"Error during 2-minute check: {e}")
                         # Reset timer anyway to avoid spam
-                        self.last_2min_check = time.time()
+                        self.last_2min_check = self.clock()
                 
-                # Log every 30 seconds to track progress
-                if int(time.time() - start_time) % 30 == 0:
+                # Log every 30 seconds to track progress (independent of loop pacing)
+                if self.clock() - last_status_log >= 30:
+                    last_status_log = self.clock()
                     logging.info(f"Task {task.id} status: inactive={is_inactive}, time_since_activity={time_since_activity:.1f}s, timeout={self.inactivity_monitor.timeout_seconds}s")
                 
                 if is_inactive:
@@ -1162,20 +1395,26 @@ class TaskExecutor:
             
             # For new windows, if Claude hasn't started after 5 minutes, assume it started anyway
             if (not claude_started and not self.terminal_manager._is_existing_window and 
-                time.time() - start_time > 300):  # 5 minutes
+                self.clock() - start_time > 300):  # 5 minutes
                 claude_started = True
                 logging.warning("Claude hasn't shown activity indicators after 5 minutes - assuming it started")
                 self.inactivity_monitor.reset()
             
             # Check for maximum execution time (safety timeout)
-            if time.time() - start_time > 3600:  # 1 hour max per task
+            if self.clock() - start_time > 3600:  # 1 hour max per task
                 task.status = TaskStatus.TIMEOUT
                 task.output = "\n".join(output_lines)
                 task.error = "Task exceeded maximum execution time"
                 logging.warning(f"Task {task.id} timed out after 1 hour")
                 break
             
-            time.sleep(1)  # Check every second
+            # Load-adaptive pacing: while output is streaming in, come back quickly
+            # to drain it; once things go quiet, ease back to the one-second tick
+            if new_output or new_errors:
+                loop_interval = self.loop_min_interval
+            else:
+                loop_interval = min(loop_interval * 2, self.loop_max_interval)
+            self.sleep(loop_interval)
         
         task.end_time = datetime.now()
         self.current_task = None
@@ -1185,45 +1424,40 @@ class TaskExecutor:
 class Scheduler:
     """Keeps track of time and makes sure we don't hit the 5-hour limit"""
     
-    def __init__(self, config: Configuration):
+    def __init__(self, config: Configuration, clock: Callable[[ZoneInfo], datetime] = datetime.now,
+                 sleep: Callable[[float], None] = time.sleep):
         self.config = config
         self.tz = ZoneInfo(config.timezone)
+        # Source of "now" and the way we wait - swap in fakes to drive scheduling
+        # without patching datetime or really sleeping
+        self.clock = clock
+        self.sleep = sleep
         self.session_start_time: Optional[datetime] = None
         self.tasks_executed = 0
         self.detected_reset_time: Optional[str] = None
         self.rate_limit_detected = False
     
+    def now(self) -> datetime:
+        """Current time in the configured timezone"""
+        return self.clock(self.tz)
+    
     def next_window_start(self) -> datetime:
         """Calculate the next execution window start time"""
-        now = datetime.now(self.tz)
+        now = self.now()
         
         # Use detected reset time if available
         if self.detected_reset_time:
             try:
-                # Parse the detected reset time
-                time_str = self.detected_reset_time.lower().strip()
-                if 'am' in time_str or 'pm' in time_str:
-                    # Parse AM/PM format
-                    time_part = time_str.replace('am', '').replace('pm', '').strip()
-                    if ':' in time_part:
-                        hh, mm = [int(x) for x in time_part.split(':')]
-                    else:
-                        hh, mm = int(time_part), 0
-                    
-                    # Handle AM/PM
-                    if 'pm' in time_str and hh != 12:
-                        hh += 12
-                    elif 'am' in time_str and hh == 12:
-                        hh = 0
-                    
-                    reset_time = now.replace(hour=hh, minute=mm, second=0, microsecond=0)
-                    
-                    # If the reset time is in the past, assume it's for tomorrow
-                    if reset_time <= now:
-                        reset_time += timedelta(days=1)
-                    
-                    logging.info(f"Using detected reset time: {self.detected_reset_time} -> {reset_time}")
-                    return reset_time
+                # Parse the detected reset time (AM/PM format)
+                hh, mm = parse_reset_clock(self.detected_reset_time)
+                reset_time = now.replace(hour=hh, minute=mm, second=0, microsecond=0)
+                
+                # If the reset time is in the past, assume it's for tomorrow
+                if reset_time <= now:
+                    reset_time += timedelta(days=1)
+                
+                logging.info(f"Using detected reset time: {self.detected_reset_time} -> {reset_time}")
+                return reset_time
             except Exception as e:
                 logging.warning(f"Failed to parse detected reset time '{self.detected_reset_time}': {e}")
         
@@ -1241,13 +1475,14 @@ class Scheduler:
         logging.info(f"Waiting until next window starts at {window_start.isoformat()}")
         
         while True:
-            now = datetime.now(self.tz)
+            now = self.now()
             if now >= window_start:
                 self.session_start_time = now
                 self.tasks_executed = 0
                 logging.info("Execution window started")
                 return
-            time.sleep(60)  # Check every minute
+            # Check every minute, but never sleep past the window start
+            self.sleep(min(60, (window_start - now).total_seconds()))
     
     def is_within_session_limit(self) -> bool:
         """Check if we're still within the session limits"""
@@ -1255,7 +1490,7 @@ class Scheduler:
             return False
         
         # Check time limit
-        elapsed = datetime.now(self.tz) - self.session_start_time
+        elapsed = self.now() - self.session_start_time
         if elapsed.total_seconds() > (self.config.session_duration_hours * 3600):
             logging.info("Session time limit reached")
             return False
@@ -1293,7 +1528,7 @@ class Scheduler:
         logging.info(f"Waiting until rate limit resets at {reset_time.isoformat()}")
         
         while True:
-            now = datetime.now(self.tz)
+            now = self.now()
             if now >= reset_time:
                 # Reset session state
                 self.session_start_time = now
@@ -1302,7 +1537,8 @@ class Scheduler:
                 self.detected_reset_time = None
                 logging.info("Rate limit reset - resuming task execution")
                 return
-            time.sleep(60)  # Check every minute
+            # Check every minute, but never sleep past the reset time
+            self.sleep(min(60, (reset_time - now).total_seconds()))
 
 
 class TerminalAutomationSystem:
@@ -1340,7 +1576,7 @@ class TerminalAutomationSystem:
     
     def __init__(self, config: Configuration):
         self.config = config
-        self.terminal_manager = TerminalManager(config.terminal_type, config.connection_mode)
+        self.terminal_manager = TerminalManager(config.terminal_type, config.connection_mode, config)
         self.inactivity_monitor = InactivityMonitor(config.inactivity_timeout)
         self.task_executor = TaskExecutor(self.terminal_manager, self.inactivity_monitor, self)
         self.scheduler = Scheduler(config)
@@ -1348,6 +1584,17 @@ class TerminalAutomationSystem:
         self._setup_logging()
         # Dual-mode clipboard polling (works for both new/existing windows)
         self._clipboard_poll_interval_sec = 30
+        # Name of the content reader that last returned text (tried first next time)
+        self._last_content_reader: Optional[str] = None
+        # Fraction of the window height (from the bottom) that screenshot OCR reads
+        self._ocr_band_fraction = 0.4
+        # Markers of our own log lines, filtered out before rate limit parsing
+        # (built once here instead of per terminal line)
+        self._log_line_markers = (
+            "- root - INFO -", "- root - ERROR -", "- root - WARNING -",
+            "night_writer", "STARTING RATE LIMIT", "CLIPBOARD METHOD",
+            "[_", "] -", "📋", "🔍", "⏰", "🚀", "Reset time:"
+        )
     
     def _setup_logging(self):
         """Setup comprehensive logging configuration with detailed tracking"""
@@ -1382,9 +1629,9 @@ class TerminalAutomationSystem:
         )
         
         # Log comprehensive system startup information
-        logging.info("="*80)
+        logging.info(SEPARATOR_WIDE)
         logging.info("🚀 NIGHT WRITER AUTOMATION SYSTEM STARTING")
-        logging.info("="*80)
+        logging.info(SEPARATOR_WIDE)
         logging.info(f"📋 Configuration Details:")
         logging.info(f"   • Terminal Type: {self.config.terminal_type.value}")
         logging.info(f"   • Connection Mode: {self.config.connection_mode.value}")
@@ -1394,30 +1641,27 @@ class TerminalAutomationSystem:
         logging.info(f"   • Auto-launch Claude: {self.config.auto_launch_claude}")
         logging.info(f"   • Transcript Enabled: {self.config.transcript_enabled}")
         logging.info(f"   • Timezone: {self.config.timezone}")
-        logging.info("="*80)
+        logging.info(SEPARATOR_WIDE)
     
     def load_tasks(self, tasks_file: str) -> bool:
         """Load tasks from JSON file"""
         try:
             tasks_path = Path(tasks_file)
-            if not tasks_path.exists():
+            # Just open it - a separate exists() check costs an extra stat per load
+            try:
+                content = tasks_path.read_text(encoding="utf-8").strip()
+            except FileNotFoundError:
                 logging.error(f"Tasks file not found: {tasks_path}")
                 return False
             
-            content = tasks_path.read_text(encoding="utf-8").strip()
             if not content:
                 logging.error("Tasks file is empty")
                 return False
             
-            # Parse JSON or plain text
-            if content.lstrip().startswith("["):
-                task_strings = json.loads(content)
-            else:
-                task_strings = [line.strip() for line in content.splitlines() if line.strip()]
-            
+            # Parse JSON or plain text straight into Task objects
             self.tasks = [
                 Task(id=i, content=task_str) 
-                for i, task_str in enumerate(task_strings)
+                for i, task_str in enumerate(self._iter_task_strings(content))
             ]
             
             logging.info(f"Loaded {len(self.tasks)} tasks")
@@ -1427,25 +1671,36 @@ class TerminalAutomationSystem:
             logging.error(f"Failed to load tasks: {e}")
             return False
     
+    @staticmethod
+    def _iter_task_strings(content: str) -> Iterable[str]:
+        """Parse already-stripped tasks file content (JSON array or one task per line)
+        
+        Uses orjson when it is installed (C parser, several times faster than
+        the stdlib on big task lists) and falls back to json otherwise. Plain
+        text is yielded lazily, stripping each line only once.
+        """
+        if content.startswith("["):
+            return orjson.loads(content) if HAS_ORJSON else json.loads(content)
+        return (stripped for line in content.splitlines() if (stripped := line.strip()))
+    
     def remove_completed_task(self, completed_task: Task) -> bool:
         """Remove a completed task from the tasks file"""
         try:
             tasks_path = Path(self.config.tasks_file)
-            if not tasks_path.exists():
+            
+            # Read current tasks from file (no separate exists() stat)
+            try:
+                content = tasks_path.read_text(encoding="utf-8").strip()
+            except FileNotFoundError:
                 logging.warning(f"Tasks file not found when trying to remove task: {tasks_path}")
                 return False
             
-            # Read current tasks from file
-            content = tasks_path.read_text(encoding="utf-8").strip()
             if not content:
                 logging.warning("Tasks file is empty when trying to remove task")
                 return False
             
             # Parse current tasks
-            if content.lstrip().startswith("["):
-                task_strings = json.loads(content)
-            else:
-                task_strings = [line.strip() for line in content.splitlines() if line.strip()]
+            task_strings = list(self._iter_task_strings(content))
             
             # Remove the completed task
             if completed_task.content in task_strings:
@@ -1471,6 +1726,18 @@ class TerminalAutomationSystem:
             logging.error(f"Failed to remove completed task from file: {e}")
             return False
     
+    @staticmethod
+    def _log_sample(text: str, limit: int, from_end: bool = False) -> str:
+        """Return the first (or last) `limit` characters of text with newlines escaped
+        
+        Captured terminal content can be many KB, so we slice before escaping
+        rather than escaping everything just to log a few hundred characters.
+        Each character escapes on its own, so the result is the same either way.
+        """
+        if from_end:
+            return text[-limit:].replace('\n', '\\n').replace('\r', '\\r')[-limit:]
+        return text[:limit].replace('\n', '\\n').replace('\r', '\\r')[:limit]
+    
     def _check_and_wait_for_rate_limits(self):
         """🔍 CORE RATE LIMIT DETECTION - Check for rate limits and wait if necessary
         
@@ -1512,7 +1779,7 @@ class TerminalAutomationSystem:
                 logging.info(f"✅ Clipboard method success: {len(terminal_content)} characters")
                 if terminal_content:
                     # Log a sample of what we captured (first 200 chars)
-                    sample = terminal_content.replace('\n', '\\n').replace('\r', '\\r')[:200]
+                    sample = self._log_sample(terminal_content, 200)
                     logging.info(f"📄 Content sample: '{sample}...'")
             except Exception as e:
                 logging.error(f"❌ Clipboard method failed: {e}")
@@ -1525,7 +1792,7 @@ class TerminalAutomationSystem:
                 terminal_content = self._read_transcript_tail() or ""
                 logging.info(f"✅ Transcript method: {len(terminal_content)} characters")
                 if terminal_content:
-                    sample = terminal_content.replace('\n', '\\n').replace('\r', '\\r')[-200:]
+                    sample = self._log_sample(terminal_content, 200, from_end=True)
                     logging.info(f"📄 Transcript sample (last 200 chars): '...{sample}'")
             except Exception as e:
                 logging.error(f"❌ Transcript method failed: {e}")
@@ -1558,7 +1825,7 @@ class TerminalAutomationSystem:
         
         if terminal_content:
             # Show a clean sample of what we're analyzing
-            clean_sample = terminal_content.replace('\n', '\\n').replace('\r', '\\r')[:300]
+            clean_sample = self._log_sample(terminal_content, 300)
             logging.info(f"📝 Content to analyze: '{clean_sample}...'")
             
             # 🧹 FILTER OUT LOG MESSAGES - Don't parse our own logs!
@@ -1569,11 +1836,7 @@ class TerminalAutomationSystem:
                 filtered_lines = []
                 for line in lines:
                     # Skip log lines and system messages
-                    if not any(pattern in line for pattern in [
-                        "- root - INFO -", "- root - ERROR -", "- root - WARNING -",
-                        "night_writer", "STARTING RATE LIMIT", "CLIPBOARD METHOD",
-                        "[_", "] -", "📋", "🔍", "⏰", "🚀", "Reset time:"
-                    ]):
+                    if not any(pattern in line for pattern in self._log_line_markers):
                         filtered_lines.append(line)
                 
                 filtered_content = '\n'.join(filtered_lines).strip()
@@ -1581,7 +1844,7 @@ class TerminalAutomationSystem:
                     logging.info(f"📝 Filtered content (removed logs): {len(filtered_content)} chars")
                     terminal_content = filtered_content
                     # Show sample of filtered content
-                    clean_sample = terminal_content.replace('\n', '\\n').replace('\r', '\\r')[:300]
+                    clean_sample = self._log_sample(terminal_content, 300)
                     logging.info(f"📝 Filtered content sample: '{clean_sample}...'")
                 else:
                     logging.info("📝 All content was log messages - treating as empty")
@@ -1595,7 +1858,7 @@ class TerminalAutomationSystem:
                 recent_content = '\n'.join(recent_lines).strip()
                 
                 logging.info(f"🎯 PARSING ONLY RECENT LINES ({len(recent_lines)} lines) FOR RATE LIMIT PATTERNS...")
-                logging.info(f"📄 Recent content: '{recent_content.replace(chr(10), '\\n')[:200]}...'")
+                logging.info(f"📄 Recent content: '{self._log_sample(recent_content, 200)}...'")
                 
                 rate_limit_info = self.task_executor.rate_limit_parser.parse_output(recent_content)
             else:
@@ -1611,22 +1874,22 @@ class TerminalAutomationSystem:
                 
                 if not is_current:
                     # This is an old/expired rate limit message
-                    logging.info("=" * 80)
+                    logging.info(SEPARATOR_WIDE)
                     logging.info("🕐 OLD RATE LIMIT MESSAGE DETECTED (EXPIRED)")
-                    logging.info("=" * 80)
+                    logging.info(SEPARATOR_WIDE)
                     logging.info(f"📋 Original message: {rate_limit_info.get('message', 'N/A')}")
                     logging.info(f"⏰ Reset time (expired): {rate_limit_info['reset_time']}")
                     logging.info("✅ Claude should be available now - proceeding with tasks")
-                    logging.info("=" * 80)
+                    logging.info(SEPARATOR_WIDE)
                     
                     # Notify progress callback that we found an old message
                     if self.progress_callback:
                         self.progress_callback("waiting", f"Found expired rate limit from {rate_limit_info['reset_time']} - Claude available", None)
                 else:
                     # ⚠️ MAJOR ALERT: Current rate limit detected!
-                    logging.warning("=" * 80)
+                    logging.warning(SEPARATOR_WIDE)
                     logging.warning("🚨 CLAUDE RATE LIMIT DETECTED! 🚨")
-                    logging.warning("=" * 80)
+                    logging.warning(SEPARATOR_WIDE)
                     logging.warning(f"📋 Original message: {rate_limit_info.get('message', 'N/A')}")
                     logging.warning(f"⏰ Reset time detected: {rate_limit_info['reset_time']}")
                     logging.warning(f"🔍 Matched pattern: {rate_limit_info.get('matched_pattern', 'N/A')}")
@@ -1640,7 +1903,7 @@ class TerminalAutomationSystem:
                 if is_current:
                     if rate_limit_info['reset_time']:
                         logging.warning(f"🕐 System will wait until Claude resets at: {rate_limit_info['reset_time']}")
-                        logging.warning("=" * 80)
+                        logging.warning(SEPARATOR_WIDE)
                         
                         # Update scheduler with detected reset time
                         self.scheduler.update_rate_limit_info(
@@ -1669,7 +1932,7 @@ class TerminalAutomationSystem:
             logging.info("No terminal content found - checking if we should wait based on time...")
             
             # Check if we're in a rate limit period based on time
-            now = datetime.now(self.scheduler.tz)
+            now = self.scheduler.now()
             if now.hour < 4:  # Before 4am, we might be in a rate limit period
                 logging.info("Current time is before 4am - assuming rate limit is active")
                 # Set a default rate limit until 4am
@@ -1686,90 +1949,36 @@ class TerminalAutomationSystem:
             if hasattr(self.terminal_manager, 'selected_window') and self.terminal_manager.selected_window:
                 logging.info("Attempting to read terminal content from existing window...")
                 
-                # Method 1: Try to read window content directly
-                try:
-                    logging.info("Trying Method 1: Direct window content reading...")
-                    content = self._read_window_content_directly()
-                    if content:
-                        logging.info(f"Read terminal content directly: {len(content)} characters")
-                        return content
-                    else:
-                        logging.info("Method 1: No content returned")
-                except Exception as e:
-                    logging.info(f"Method 1 failed: {e}")
-                
-                # Method 2: Try to send a simple command
-                try:
-                    logging.info("Trying Method 2: Simple command...")
-                    content = self._try_simple_command()
-                    if content:
-                        logging.info(f"Read terminal content via simple command: {len(content)} characters")
-                        return content
-                    else:
-                        logging.info("Method 2: No content returned")
-                except Exception as e:
-                    logging.info(f"Method 2 failed: {e}")
-                
-                # Method 3: Try PowerShell command
-                try:
-                    logging.info("Trying Method 3: PowerShell command...")
-                    content = self._try_powershell_command()
-                    if content:
-                        logging.info(f"Read terminal content via PowerShell: {len(content)} characters")
-                        return content
-                    else:
-                        logging.info("Method 3: No content returned")
-                except Exception as e:
-                    logging.info(f"Method 3 failed: {e}")
-                
-                # Method 4: Try to read console buffer directly
-                try:
-                    logging.info("Trying Method 4: Console buffer reading...")
-                    content = self._try_console_buffer_reading()
-                    if content:
-                        logging.info(f"Read terminal content via console buffer: {len(content)} characters")
-                        return content
-                    else:
-                        logging.info("Method 4: No content returned")
-                except Exception as e:
-                    logging.info(f"Method 4 failed: {e}")
-                
-                # Method 5: Try clipboard copy method (BEST!)
-                try:
-                    logging.info("Trying Method 5: Clipboard copy method...")
-                    content = self._try_clipboard_copy_method()
-                    if content:
-                        logging.info(f"Read terminal content via clipboard: {len(content)} characters")
-                        return content
-                    else:
-                        logging.info("Method 5: No content returned")
-                except Exception as e:
-                    logging.info(f"Method 5 failed: {e}")
-                
-                # Method 6: Try direct terminal reading
-                try:
-                    logging.info("Trying Method 6: Direct terminal reading...")
-                    content = self._try_direct_terminal_reading()
-                    if content:
-                        logging.info(f"Read terminal content via direct reading: {len(content)} characters")
-                        return content
-                    else:
-                        logging.info("Method 6: No content returned")
-                except Exception as e:
-                    logging.info(f"Method 6 failed: {e}")
+                # Every reader we know, in order of preference. Each one may spawn
+                # commands, focus the window or run OCR, so once a reader works we
+                # remember it and try it first next time instead of re-running the
+                # ones that already failed for this window.
+                readers = [
+                    ("Direct window content reading", self._read_window_content_directly),
+                    ("Simple command", self._try_simple_command),
+                    ("PowerShell command", self._try_powershell_command),
+                    ("Console buffer reading", self._try_console_buffer_reading),
+                    ("Clipboard copy method", self._try_clipboard_copy_method),
+                    ("Direct terminal reading", self._try_direct_terminal_reading),
+                    ("Screenshot + OCR", self._try_screenshot_ocr),
+                ]
+                numbered = list(enumerate(readers, 1))
+                numbered.sort(key=lambda item: item[1][0] != self._last_content_reader)
                 
-                # Method 7: Try screenshot + OCR (fallback)
-                try:
-                    logging.info("Trying Method 7: Screenshot + OCR...")
-                    content = self._try_screenshot_ocr()
-                    if content:
-                        logging.info(f"Read terminal content via screenshot OCR: {len(content)} characters")
-                        return content
-                    else:
-                        logging.info("Method 7: No content returned")
-                except Exception as e:
-                    logging.info(f"Method 7 failed: {e}")
+                for method_number, (reader_name, reader) in numbered:
+                    try:
+                        logging.info(f"Trying Method {method_number}: {reader_name}...")
+                        content = reader()
+                        if content:
+                            logging.info(f"Read terminal content via {reader_name}: {len(content)} characters")
+                            self._last_content_reader = reader_name
+                            return content
+                        else:
+                            logging.info(f"Method {method_number}: No content returned")
+                    except Exception as e:
+                        logging.info(f"Method {method_number} failed: {e}")
                 
+                self._last_content_reader = None
                 logging.warning("All methods failed to read terminal content - will assume no rate limit")
                 return ""
             
@@ -1815,15 +2024,17 @@ class TerminalAutomationSystem:
                         'windows terminal', 'git bash', 'ubuntu', 'wsl'
                     ]
                     
-                    is_window_title = any(title_indicator in window_text.lower() for title_indicator in window_title_indicators)
-                    has_terminal_content = any(indicator in window_text.lower() for indicator in terminal_content_indicators)
+                    # Lowercase once - inside the any() generators it would be redone per indicator
+                    window_text_lower = window_text.lower()
+                    is_window_title = any(title_indicator in window_text_lower for title_indicator in window_title_indicators)
+                    has_terminal_content = any(indicator in window_text_lower for indicator in terminal_content_indicators)
                     
                     is_terminal_content = (
                         (len(window_text) > 100 and not is_window_title) or  # Long content that's not a title
                         (has_terminal_content and not is_window_title) or  # Has terminal indicators but not a title
                         window_text.count('\n') > 2 or  # Multiple lines suggest terminal output
                         '5-hour limit reached' in window_text or
-                        'resets' in window_text.lower()
+                        'resets' in window_text_lower
                     )
                     
                     if is_terminal_content:
@@ -1834,48 +2045,10 @@ class TerminalAutomationSystem:
             except Exception as e:
                 logging.info(f"GetWindowText failed: {e}")
             
-            # Method 2: Try SendMessage approach
-            try:
-                logging.info("Getting window text length...")
-                text_length = win32gui.SendMessage(hwnd, win32con.WM_GETTEXTLENGTH, 0, 0)
-                logging.info(f"Window text length: {text_length}")
-                
-                if text_length > 0:
-                    # Get window text
-                    logging.info("Creating text buffer...")
-                    text_buffer = win32gui.PyMakeBuffer(text_length + 1)
-                    logging.info("Getting window text...")
-                    win32gui.SendMessage(hwnd, win32con.WM_GETTEXT, text_length + 1, text_buffer)
-                    # Convert buffer to string properly
-                    try:
-                        # Try different approaches to decode the buffer
-                        if hasattr(text_buffer, 'decode'):
-                            content = text_buffer[:text_length].decode('utf-8', errors='ignore')
-                        else:
-                            # Convert to bytes first
-                            content_bytes = bytes(text_buffer[:text_length])
-                            content = content_bytes.decode('utf-8', errors='ignore')
-                    except Exception as decode_error:
-                        logging.info(f"Decode error: {decode_error}, trying alternative method")
-                        # Try as string directly
-                        try:
-                            content = str(text_buffer[:text_length])
-                        except:
-                            content = ""
-                    
-                    if content and len(content.strip()) > 0:
-                        logging.info(f"SendMessage returned: {len(content)} characters")
-                        # This is likely still just the window title, not terminal content
-                        logging.info("SendMessage approach also returned window title, not terminal content")
-                    else:
-                        logging.info("SendMessage returned empty content")
-                else:
-                    logging.info("Window has no text content")
-            except Exception as e:
-                logging.info(f"SendMessage approach failed: {e}")
-            
-            # Both GetWindowText and SendMessage only returned window title, not terminal content
-            logging.info("Direct window reading methods only found window title, not terminal content")
+            # GetWindowText already sends WM_GETTEXT under the hood, so a second
+            # WM_GETTEXTLENGTH + WM_GETTEXT round trip would just return the same
+            # window title again - no need to ask twice.
+            logging.info("Direct window reading only found window title, not terminal content")
             return None
         except Exception as e:
             logging.info(f"Direct window reading failed: {e}")
@@ -2233,6 +2406,7 @@ class TerminalAutomationSystem:
             hwnd = self.terminal_manager.selected_window['hwnd']
             logging.info(f"Attempting to read console buffer for window {hwnd}")
             
+            import array
             import ctypes
             from ctypes import wintypes, Structure, c_char, c_short, c_ushort, c_ulong
             
@@ -2302,15 +2476,15 @@ class TerminalAutomationSystem:
                         COORD(0, 0),
                         ctypes.byref(read_region)
                     ):
-                        # Extract text from buffer
+                        # Extract text from buffer. Each CHAR_INFO is two 16-bit
+                        # words (char, attributes), so copy the raw buffer out once
+                        # and take every other word - much cheaper than building a
+                        # ctypes struct and appending one character at a time per cell.
+                        char_codes = array.array('H', bytes(char_buffer))[0::2]
                         text_lines = []
                         for y in range(buffer_height):
-                            line = ""
-                            for x in range(buffer_width):
-                                char_info = char_buffer[y * buffer_width + x]
-                                char_code = char_info.Char
-                                if char_code != 0:  # Skip null characters
-                                    line += chr(char_code)
+                            row = char_codes[y * buffer_width:(y + 1) * buffer_width]
+                            line = "".join(map(chr, row)).replace("\0", "")  # Skip null characters
                             
                             if line.strip():  # Only add non-empty lines
                                 text_lines.append(line.rstrip())
@@ -2337,6 +2511,80 @@ class TerminalAutomationSystem:
             logging.info(f"Console buffer reading failed: {e}")
             return None
     
+    def _capture_window_image(self, hwnd: int):
+        """Render a window into an off-screen bitmap with PrintWindow
+        
+        Unlike ImageGrab, which copies whatever pixels are on screen at the
+        window's position, this asks the window to paint itself, so it still
+        works when the terminal is behind other windows. Returns a PIL image,
+        or None if the window could not be rendered.
+        """
+        import ctypes
+        try:
+            import win32ui  # Pythonwin/MFC - only this capture path needs it
+        except ImportError as e:
+            logging.info(f"win32ui not available, skipping PrintWindow capture: {e}")
+            return None
+        
+        PW_RENDERFULLCONTENT = 2  # Needed for DirectX-drawn windows like Windows Terminal
+        
+        hwnd_dc = None
+        window_dc = None
+        memory_dc = None
+        bitmap = None
+        try:
+            left, top, right, bottom = win32gui.GetWindowRect(hwnd)
+            width, height = right - left, bottom - top
+            if width <= 0 or height <= 0:
+                return None
+            
+            # Memory device context + bitmap the window will paint into
+            hwnd_dc = win32gui.GetWindowDC(hwnd)
+            window_dc = win32ui.CreateDCFromHandle(hwnd_dc)
+            memory_dc = window_dc.CreateCompatibleDC()
+            bitmap = win32ui.CreateBitmap()
+            bitmap.CreateCompatibleBitmap(window_dc, width, height)
+            memory_dc.SelectObject(bitmap)
+            
+            if not ctypes.windll.user32.PrintWindow(hwnd, memory_dc.GetSafeHdc(), PW_RENDERFULLCONTENT):
+                logging.info("PrintWindow returned failure")
+                return None
+            
+            info = bitmap.GetInfo()
+            image = Image.frombuffer(
+                "RGB", (info['bmWidth'], info['bmHeight']),
+                bitmap.GetBitmapBits(True), "raw", "BGRX", 0, 1
+            )
+            
+            # Some windows "succeed" but paint nothing - treat an all-black frame as failure
+            if image.getbbox() is None:
+                logging.info("PrintWindow produced an empty frame")
+                return None
+            return image
+            
+        except Exception as e:
+            logging.info(f"PrintWindow capture failed: {e}")
+            return None
+        finally:
+            # GDI handles are a limited resource - always release them. The DCs go
+            # in reverse order of creation, and the bitmap only after memory_dc is
+            # deleted, since GDI won't delete a bitmap still selected into a DC.
+            # Each release is guarded on its own so one failure can't skip the rest.
+            releases = []
+            if memory_dc is not None:
+                releases.append(memory_dc.DeleteDC)
+            if window_dc is not None:
+                releases.append(window_dc.DeleteDC)
+            if hwnd_dc is not None:
+                releases.append(lambda: win32gui.ReleaseDC(hwnd, hwnd_dc))
+            if bitmap is not None:
+                releases.append(lambda: win32gui.DeleteObject(bitmap.GetHandle()))
+            for release in releases:
+                try:
+                    release()
+                except Exception as e:
+                    logging.debug(f"GDI cleanup step failed: {e}")
+    
     def _try_screenshot_ocr(self):
         """Try to read terminal content using screenshot + OCR"""
         try:
@@ -2345,87 +2593,114 @@ class TerminalAutomationSystem:
             
             logging.info(f"Taking screenshot of window: {window_title}")
             
-            # First, ensure the window is visible and focused
-            try:
-                # Restore window if minimized
-                win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
-                time.sleep(0.2)
+            # Preferred: PrintWindow asks the terminal to paint itself into our own
+            # bitmap, so it works while the window is covered - no focus juggling or
+            # sleeps. Minimized windows have nothing to paint, so they skip straight
+            # to the on-screen capture below.
+            screenshot = None
+            if not win32gui.IsIconic(hwnd):
+                screenshot = self._capture_window_image(hwnd)
+            
+            if screenshot is not None:
+                logging.info(f"Screenshot captured via PrintWindow: {screenshot.size}")
                 
-                # Try to bring window to front
-                win32gui.BringWindowToTop(hwnd)
-                time.sleep(0.2)
+                # Save screenshot for debugging
+                screenshot.save("debug_terminal_screenshot.png")
+                logging.info("Screenshot saved as debug_terminal_screenshot.png")
+            else:
+                logging.info("PrintWindow capture unavailable, falling back to on-screen capture")
                 
-                # Try to set foreground (may fail, but that's ok)
+                # First, ensure the window is visible and focused
                 try:
-                    win32gui.SetForegroundWindow(hwnd)
+                    # Restore window if minimized
+                    win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
                     time.sleep(0.2)
-                except Exception as e:
-                    logging.info(f"SetForegroundWindow failed (this is ok): {e}")
-                
-            except Exception as e:
-                logging.info(f"Window activation failed (this is ok): {e}")
-            
-            # Method 1: Try using pygetwindow to get window bounds
-            try:
-                windows = gw.getWindowsWithTitle(window_title)
-                if windows:
-                    window = windows[0]
-                    logging.info(f"Found window via pygetwindow: {window.left}, {window.top}, {window.width}, {window.height}")
-                    
-                    # Take screenshot of the window
-                    bbox = (window.left, window.top, window.left + window.width, window.top + window.height)
-                    screenshot = ImageGrab.grab(bbox=bbox)
-                    logging.info(f"Screenshot captured: {screenshot.size}")
-                    
-                    # Save screenshot for debugging
-                    screenshot.save("debug_terminal_screenshot.png")
-                    logging.info("Screenshot saved as debug_terminal_screenshot.png")
                     
-                else:
-                    logging.info("Window not found via pygetwindow, trying win32gui approach")
-                    # Method 2: Use win32gui to get window rectangle
-                    rect = win32gui.GetWindowRect(hwnd)
-                    left, top, right, bottom = rect
-                    logging.info(f"Window rect via win32gui: {left}, {top}, {right}, {bottom}")
-                    
-                    # Take screenshot of the window
-                    bbox = (left, top, right, bottom)
-                    screenshot = ImageGrab.grab(bbox=bbox)
-                    logging.info(f"Screenshot captured: {screenshot.size}")
+                    # Try to bring window to front
+                    win32gui.BringWindowToTop(hwnd)
+                    time.sleep(0.2)
                     
-                    # Save screenshot for debugging
-                    screenshot.save("debug_terminal_screenshot.png")
-                    logging.info("Screenshot saved as debug_terminal_screenshot.png")
+                    # Try to set foreground (may fail, but that's ok)
+                    try:
+                        win32gui.SetForegroundWindow(hwnd)
+                        time.sleep(0.2)
+                    except Exception as e:
+                        logging.info(f"SetForegroundWindow failed (this is ok): {e}")
                     
-            except Exception as e:
-                logging.info(f"Screenshot capture failed: {e}")
-                return None
+                except Exception as e:
+                    logging.info(f"Window activation failed (this is ok): {e}")
+                
+                # Method 1: Try using pygetwindow to get window bounds
+                try:
+                    windows = gw.getWindowsWithTitle(window_title)
+                    if windows:
+                        window = windows[0]
+                        logging.info(f"Found window via pygetwindow: {window.left}, {window.top}, {window.width}, {window.height}")
+                        
+                        # Take screenshot of the window
+                        bbox = (window.left, window.top, window.left + window.width, window.top + window.height)
+                        screenshot = ImageGrab.grab(bbox=bbox)
+                        logging.info(f"Screenshot captured: {screenshot.size}")
+                        
+                        # Save screenshot for debugging
+                        screenshot.save("debug_terminal_screenshot.png")
+                        logging.info("Screenshot saved as debug_terminal_screenshot.png")
+                        
+                    else:
+                        logging.info("Window not found via pygetwindow, trying win32gui approach")
+                        # Method 2: Use win32gui to get window rectangle
+                        rect = win32gui.GetWindowRect(hwnd)
+                        left, top, right, bottom = rect
+                        logging.info(f"Window rect via win32gui: {left}, {top}, {right}, {bottom}")
+                        
+                        # Take screenshot of the window
+                        bbox = (left, top, right, bottom)
+                        screenshot = ImageGrab.grab(bbox=bbox)
+                        logging.info(f"Screenshot captured: {screenshot.size}")
+                        
+                        # Save screenshot for debugging
+                        screenshot.save("debug_terminal_screenshot.png")
+                        logging.info("Screenshot saved as debug_terminal_screenshot.png")
+                        
+                except Exception as e:
+                    logging.info(f"Screenshot capture failed: {e}")
+                    return None
+            
+            # Keep only the bottom band of the window. Rate limit messages are only
+            # searched for in the most recent lines, and OCR time grows with pixel count.
+            width, height = screenshot.size
+            band_top = int(height * (1 - self._ocr_band_fraction))
+            screenshot = screenshot.crop((0, band_top, width, height))
+            logging.info(f"Cropped screenshot to bottom {self._ocr_band_fraction:.0%}: {screenshot.size}")
             
             # Initialize EasyOCR reader (English only for better performance)
             if not HAS_OCR:
                 logging.info("EasyOCR not available, skipping OCR method")
                 return None
                 
-            logging.info("Initializing EasyOCR...")
-            reader = easyocr.Reader(['en'], gpu=False)  # Use CPU for better compatibility
+            logging.info("Getting shared EasyOCR reader...")
+            reader = get_ocr_reader()
             
             # Perform OCR on the screenshot
             logging.info("Performing OCR on screenshot...")
-            # Convert PIL Image to numpy array for EasyOCR
+            # Convert PIL Image to numpy array for EasyOCR. np.asarray wraps the
+            # image's exported buffer (read-only view) instead of np.array's extra
+            # copy; EasyOCR only reads the pixels
             try:
                 import numpy as np
-                screenshot_array = np.array(screenshot)
+                screenshot_array = np.asarray(screenshot)
                 results = reader.readtext(screenshot_array)
             except ImportError:
                 logging.info("NumPy not available, skipping OCR method")
                 return None
             
-            # Extract text from OCR results
-            extracted_text = []
-            for (bbox, text, confidence) in results:
-                if confidence > 0.5:  # Only include high-confidence text
-                    extracted_text.append(text)
-                    logging.info(f"OCR result: '{text}' (confidence: {confidence:.2f})")
+            # Extract text from OCR results - keep only high-confidence text, selected
+            # with one vectorized comparison over all confidences
+            confidences = np.fromiter((confidence for _, _, confidence in results), dtype=float, count=len(results))
+            confident_indices = np.flatnonzero(confidences > 0.5)
+            extracted_text = [results[i][1] for i in confident_indices]
+            for i in confident_indices:
+                logging.info(f"OCR result: '{results[i][1]}' (confidence: {confidences[i]:.2f})")
             
             if extracted_text:
                 content = "\n".join(extracted_text)
@@ -2617,8 +2892,7 @@ class TerminalAutomationSystem:
                 return False
             
             # Set session start time after rate limit check
-            from datetime import datetime
-            self.scheduler.session_start_time = datetime.now(self.scheduler.tz)
+            self.scheduler.session_start_time = self.scheduler.now()
             self.scheduler.tasks_executed = 0
             
             # Execute tasks continuously
@@ -2758,13 +3032,13 @@ class TerminalAutomationSystem:
             try:
                 self.run_session()
                 logging.info("Waiting for next execution window...")
-                time.sleep(60)  # Check every minute
+                self.scheduler.sleep(60)  # Check every minute
             except KeyboardInterrupt:
                 logging.info("Automation stopped by user")
                 break
             except Exception as e:
                 logging.error(f"Continuous mode error: {e}")
-                time.sleep(300)  # Wait 5 minutes before retrying
+                self.scheduler.sleep(300)  # Wait 5 minutes before retrying
 
 
 def main():